@@ -15,18 +15,31 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
+from typing import Union
 import enum
 import http
 
-__all__ = ["HttpVersion", "HttpRequestMethod", "HttpStatusCode"]
+__all__ = [
+    "HttpVersion",
+    "HttpRequestMethod",
+    "HttpStatusCode",
+    "refine_status_code",
+]
 
 
-class HttpVersion(enum.Enum):
+class _CachedReprEnum(enum.Enum):
+    _cached_repr: str
+
+    def __repr__(self) -> str:
+        return self._cached_repr
+
+
+class HttpVersion(_CachedReprEnum):
     V1_0 = "HTTP/1.0"
     V1_1 = "HTTP/1.1"
 
 
-class HttpRequestMethod(enum.Enum):
+class HttpRequestMethod(_CachedReprEnum):
     GET = "GET"
     POST = "POST"
     PUT = "PUT"
@@ -38,4 +51,32 @@ class HttpRequestMethod(enum.Enum):
     PATCH = "PATCH"
 
 
+for _member in (*HttpVersion, *HttpRequestMethod):
+    # Members are a small fixed set, so their reprs are formatted only once.
+    _member._cached_repr = enum.Enum.__repr__(_member)
+
+del _member
+
 HttpStatusCode = http.HTTPStatus
+
+_HTTP_STATUS_CODES = {
+    status_code.value: status_code for status_code in HttpStatusCode
+}
+
+
+def refine_status_code(
+    status_code: Union[int, HttpStatusCode],
+) -> HttpStatusCode:
+    """
+    Return the :class:`HttpStatusCode` member for a status code.
+
+    Known codes are resolved from a table built at import time instead of
+    calling the enum constructor.
+    """
+    if type(status_code) is HttpStatusCode:
+        return status_code
+
+    if status_code in _HTTP_STATUS_CODES:
+        return _HTTP_STATUS_CODES[status_code]
+
+    return HttpStatusCode(status_code)
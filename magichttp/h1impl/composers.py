@@ -25,11 +25,25 @@ _SELF_IDENTIFIER = f"magichttp/{_version.__version__}"
 
 _HeaderType = Union[Mapping[str, str], Iterable[Tuple[str, str]]]
 
+_REQUEST_LINE_PREFIXES = {
+    method: f"{method.value} " for method in constants.HttpRequestMethod
+}
+_REQUEST_LINE_SUFFIXES = {
+    version: f" {version.value}\r\n" for version in constants.HttpVersion
+}
+_STATUS_LINES = {
+    (version, status_code): (
+        f"{version.value} {status_code.value} {status_code.phrase}\r\n"
+    )
+    for version in constants.HttpVersion
+    for status_code in constants.HttpStatusCode
+}
+
 
 def _compose_initial_bytes(
-    *first_line_args: str, headers: Mapping[str, str], _prefix: str = ""
+    *first_line_parts: str, headers: Mapping[str, str], _prefix: str = ""
 ) -> bytes:
-    parts = [_prefix, " ".join(first_line_args), "\r\n"]
+    parts = [_prefix, *first_line_parts]
 
     for key, value in headers.items():
         parts.append("{}: {}\r\n".format(key.title(), value))
@@ -78,7 +92,10 @@ def compose_request_initial(
     return (
         refined_initial,
         _compose_initial_bytes(
-            method.value, uri, version.value, headers=refined_initial.headers
+            _REQUEST_LINE_PREFIXES[method],
+            uri,
+            _REQUEST_LINE_SUFFIXES[version],
+            headers=refined_initial.headers,
         ),
     )
 
@@ -164,27 +181,40 @@ def compose_response_initial(
     return (
         refined_initial,
         _compose_initial_bytes(
-            version.value,
-            str(status_code.value),
-            status_code.phrase,
+            _STATUS_LINES[(version, status_code)],
             headers=refined_initial.headers,
             _prefix=prefix,
         ),
     )
 
 
-def compose_chunked_body(data: bytes, finished: bool = False) -> bytes:
+def compose_chunked_body_parts(
+    data: bytes, finished: bool = False
+) -> Tuple[bytes, ...]:
     if data:
-        data_len = f"{len(data):x}".encode("utf-8")
-
         if finished:
-            return b"%s\r\n%s\r\n0\r\n\r\n" % (data_len, data)
+            return (b"%x\r\n" % len(data), data, b"\r\n0\r\n\r\n")
 
         else:
-            return b"%s\r\n%s\r\n" % (data_len, data)
+            return (b"%x\r\n" % len(data), data, b"\r\n")
 
     elif finished:
-        return b"0\r\n\r\n"
+        return (b"0\r\n\r\n",)
 
     else:
-        return b""
+        return ()
+
+
+def compose_chunked_body(data: bytes, finished: bool = False) -> bytes:
+    return b"".join(compose_chunked_body_parts(data, finished=finished))
+
+
+def compose_identity_body_parts(
+    data: bytes, _finished: bool = False
+) -> Tuple[bytes, ...]:
+    # An identity body has no terminator. _finished is accepted only so the
+    # stream managers can call both body composers the same way.
+    if data:
+        return (data,)
+
+    return ()
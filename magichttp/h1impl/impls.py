@@ -59,7 +59,10 @@ class BaseH1Impl(protocols.BaseHttpProtocolDelegate):
     def _stream(self) -> stream_mgrs.BaseH1StreamManager:  # pragma: no cover
         raise NotImplementedError
 
-    def data_received(self, data: bytes) -> None:
+    def data_received(self, data: Union[bytes, memoryview]) -> None:
+        if not self._buf and self._stream._try_append_body_directly(data):
+            return
+
         self._buf += data
 
         self._stream._data_appended()
@@ -119,6 +122,16 @@ class H1ServerImpl(BaseH1Impl, protocols.HttpServerProtocolDelegate):
         return self.__stream
 
     async def read_request(self) -> readers.HttpRequestReader:
+        reader = await self.read_request_or_none()
+
+        if reader is None:
+            raise readers.ReadFinishedError
+
+        return reader
+
+    async def read_request_or_none(
+        self,
+    ) -> Optional[readers.HttpRequestReader]:
         async with self._read_request_lock:
             if self._request_read:
                 await self._stream._wait_finished()
@@ -127,7 +140,7 @@ class H1ServerImpl(BaseH1Impl, protocols.HttpServerProtocolDelegate):
                     if self._exc:
                         raise self._exc
 
-                    raise readers.ReadFinishedError
+                    return None
 
                 self._resume_reading()
 
@@ -24,6 +24,11 @@ from .. import constants, initials
 BODY_IS_CHUNKED = -1
 BODY_IS_ENDLESS = -2
 
+_HTTP_REQUEST_METHODS = {
+    method.value: method for method in constants.HttpRequestMethod
+}
+_HTTP_VERSIONS = {version.value: version for version in constants.HttpVersion}
+
 
 class UnparsableHttpMessage(ValueError):
     pass
@@ -77,8 +82,10 @@ def _parse_content_length_header(cl_header_str: str) -> int:
         ) from e
 
 
-def _split_initial_lines(buf: bytearray) -> Optional[List[str]]:
-    pos = buf.find(b"\r\n\r\n")
+def _split_initial_lines(
+    buf: bytearray, start_pos: int
+) -> Optional[List[str]]:
+    pos = buf.find(b"\r\n\r\n", start_pos)
 
     if pos == -1:
         return None
@@ -107,9 +114,9 @@ def _parse_headers(
 
 
 def parse_request_initial(
-    buf: bytearray,
+    buf: bytearray, *, start_pos: int = 0
 ) -> Optional[initials.HttpRequestInitial]:
-    initial_lines = _split_initial_lines(buf)
+    initial_lines = _split_initial_lines(buf, start_pos)
 
     if initial_lines is None:
         return None
@@ -120,8 +127,8 @@ def parse_request_initial(
         headers = _parse_headers(initial_lines)
 
         return initials.HttpRequestInitial(
-            constants.HttpRequestMethod(method_buf.upper().strip()),
-            version=constants.HttpVersion(version_buf.upper().strip()),
+            _HTTP_REQUEST_METHODS[method_buf.upper().strip()],
+            version=_HTTP_VERSIONS[version_buf.upper().strip()],
             uri=path_buf,
             authority=headers.get("host", None),
             scheme=headers.get_first("x-scheme", None),
@@ -131,16 +138,19 @@ def parse_request_initial(
     except InvalidHeader:
         raise
 
-    except (IndexError, ValueError) as e:
+    except (IndexError, KeyError, ValueError) as e:
         raise UnparsableHttpMessage(
             "Unable to unpack the first line of the initial."
         ) from e
 
 
 def parse_response_initial(
-    buf: bytearray, req_initial: initials.HttpRequestInitial
+    buf: bytearray,
+    req_initial: initials.HttpRequestInitial,
+    *,
+    start_pos: int = 0,
 ) -> Optional[initials.HttpResponseInitial]:
-    initial_lines = _split_initial_lines(buf)
+    initial_lines = _split_initial_lines(buf, start_pos)
 
     if initial_lines is None:
         return None
@@ -150,7 +160,7 @@ def parse_response_initial(
             0
         ).split(" ")
 
-        status_code = constants.HttpStatusCode(int(status_code_buf, 10))
+        status_code = constants.refine_status_code(int(status_code_buf, 10))
 
         if status_code == constants.HttpStatusCode.CONTINUE:
             # Trim off 100 continue
@@ -158,14 +168,14 @@ def parse_response_initial(
 
         return initials.HttpResponseInitial(
             status_code,
-            version=constants.HttpVersion(version_buf),
+            version=_HTTP_VERSIONS[version_buf],
             headers=_parse_headers(initial_lines),
         )
 
     except InvalidHeader:
         raise
 
-    except (IndexError, ValueError) as e:
+    except (IndexError, KeyError, ValueError) as e:
         raise UnparsableHttpMessage(
             "Unable to unpack the first line of the initial."
         ) from e
@@ -15,10 +15,19 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-from typing import Generic, Iterable, Mapping, Optional, Tuple, TypeVar, Union
+from typing import (
+    Callable,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 import abc
 import asyncio
-import contextlib
 import typing
 
 from .. import constants, readers, writers
@@ -33,6 +42,10 @@ _HeaderType = Union[Mapping[str, str], Iterable[Tuple[str, str]]]
 
 _LAST_CHUNK = -1
 
+# Chunk payloads parsed from one batch of data are handed to the reader
+# together, but never more than this much at once.
+_BODY_PARTS_FLUSH_SIZE = 32 * 1024  # 32K
+
 
 if typing.TYPE_CHECKING:  # pragma: no cover
 
@@ -43,6 +56,9 @@ if typing.TYPE_CHECKING:  # pragma: no cover
             raise NotImplementedError("You cannot cancel this future.")
 
         async def safe_await(self) -> _T:
+            if self.done():
+                return self.result()
+
             return await asyncio.shield(self)
 
 
@@ -55,6 +71,9 @@ else:
             raise NotImplementedError("You cannot cancel this future.")
 
         async def safe_await(self) -> _T:
+            if self.done():
+                return self.result()
+
             return await asyncio.shield(self)
 
 
@@ -70,27 +89,31 @@ class BaseH1StreamManager(
         self._transport = self._protocol.transport
 
         self._max_initial_size = max_initial_size
+        self._initial_scan_pos = 0
 
         self._body_len: Optional[int] = None
         self._current_chunk_len: Optional[int] = None
         self._current_chunk_crlf_dropped = True
         self._read_exc: Optional[readers.BaseReadException] = None
 
-        self._writer_ready = asyncio.Event()
-        self._write_chunked_body: Optional[bool] = None
+        self._compose_body_parts: Optional[
+            Callable[[bytes, bool], Tuple[bytes, ...]]
+        ] = None
         self._write_finished = False
         self._write_exc: Optional[writers.BaseWriteException] = None
 
         self._last_stream: Optional[bool] = None
 
+        self._stream_finished = asyncio.Event()
+
     def pause_reading(self) -> None:
-        if self._finished():
+        if self._impl._reading_paused or self._finished():
             return
 
         self._impl._pause_reading()
 
     def resume_reading(self) -> None:
-        if self._finished():
+        if not self._impl._reading_paused or self._finished():
             return
 
         self._impl._resume_reading()
@@ -113,60 +136,100 @@ class BaseH1StreamManager(
     def _try_parse_initial(self) -> None:  # pragma: no cover
         raise NotImplementedError
 
+    def _next_initial_scan_pos(self) -> int:
+        # The end of the initial has not been found in the buffer, so the
+        # next search only needs to cover the bytes that may still be part
+        # of a "\r\n\r\n" split across packets.
+        return max(len(self._buf) - 3, 0)
+
     def _try_parse_chunked_body(self) -> None:
         reader = self._reader_fur.result()
 
-        while True:
-            if (
-                self._current_chunk_len is None
-                or self._current_chunk_len == _LAST_CHUNK
-            ):
-                if self._current_chunk_crlf_dropped is False:
-                    if len(self._buf) < 2:
-                        return
+        body_parts: List[bytearray] = []
+        body_parts_len = 0
+        end_reached = False
+        read_exc: Optional[readers.BaseReadException] = None
 
-                    del self._buf[:2]
+        try:
+            while True:
+                if (
+                    self._current_chunk_len is None
+                    or self._current_chunk_len == _LAST_CHUNK
+                ):
+                    if self._current_chunk_crlf_dropped is False:
+                        if len(self._buf) < 2:
+                            break
 
-                    self._current_chunk_crlf_dropped = True
+                        del self._buf[:2]
 
-                    if self._current_chunk_len == _LAST_CHUNK:
-                        reader._append_end(None)
+                        self._current_chunk_crlf_dropped = True
 
-                        self._maybe_cleanup()
+                        if self._current_chunk_len == _LAST_CHUNK:
+                            end_reached = True
 
-                        return
+                            break
 
-                self._current_chunk_len = parsers.parse_chunk_length(self._buf)
+                    self._current_chunk_len = parsers.parse_chunk_length(
+                        self._buf
+                    )
 
-                if self._current_chunk_len is None:
-                    if len(self._buf) > self._max_initial_size:
-                        self._set_read_exception(
-                            readers.EntityTooLargeError(
+                    if self._current_chunk_len is None:
+                        if len(self._buf) > self._max_initial_size:
+                            read_exc = readers.EntityTooLargeError(
                                 "Chunk size cannot be found "
                                 "before the initial size has been reached,"
                             )
-                        )
 
-                    return
+                        break
 
-                self._current_chunk_crlf_dropped = False
+                    self._current_chunk_crlf_dropped = False
 
-                if self._current_chunk_len == 0:
-                    self._current_chunk_len = _LAST_CHUNK
+                    if self._current_chunk_len == 0:
+                        self._current_chunk_len = _LAST_CHUNK
 
-                    continue
+                        continue
 
-            data = self._buf[: self._current_chunk_len]
-            del self._buf[: self._current_chunk_len]
+                data = self._buf[: self._current_chunk_len]
+                del self._buf[: self._current_chunk_len]
 
-            self._current_chunk_len -= len(data)
+                self._current_chunk_len -= len(data)
 
-            reader._append_data(data)
+                body_parts.append(data)
+                body_parts_len += len(data)
 
-            if self._current_chunk_len > 0:
-                return
+                if body_parts_len >= _BODY_PARTS_FLUSH_SIZE:
+                    self._flush_body_parts(reader, body_parts)
+                    body_parts_len = 0
+
+                if self._current_chunk_len > 0:
+                    break
+
+                self._current_chunk_len = None
 
-            self._current_chunk_len = None
+        finally:
+            # Hand what has been parsed to the reader even if a malformed
+            # chunk length has been found.
+            self._flush_body_parts(reader, body_parts)
+
+        if end_reached:
+            reader._append_end(None)
+
+            self._maybe_cleanup()
+
+        elif read_exc is not None:
+            self._set_read_exception(read_exc)
+
+    def _flush_body_parts(
+        self, reader: readers.BaseHttpStreamReader, body_parts: List[bytearray]
+    ) -> None:
+        if len(body_parts) == 1:
+            # Usually one chunk per packet, skip the extra copy of a join.
+            reader._append_data(body_parts[0])
+
+        elif body_parts:
+            reader._append_data(b"".join(body_parts))
+
+        body_parts.clear()
 
     def _try_parse_body(self) -> None:
         assert self._body_len is not None
@@ -186,6 +249,12 @@ class BaseH1StreamManager(
         data = self._buf[: self._body_len]
         del self._buf[: self._body_len]
 
+        self._append_body(data)
+
+    def _append_body(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        assert self._body_len is not None
+        reader = self._reader_fur.result()
+
         self._body_len -= len(data)
 
         reader._append_data(data)
@@ -195,19 +264,47 @@ class BaseH1StreamManager(
 
             self._maybe_cleanup()
 
+    def _try_append_body_directly(
+        self, data: Union[bytes, memoryview]
+    ) -> bool:
+        # Body data that does not need to be scanned is handed to the reader
+        # without going through the connection buffer.
+        # The caller MUST make sure that the connection buffer is empty.
+        if self._body_len is None or self._read_finished():
+            return False
+
+        if self._body_len == parsers.BODY_IS_ENDLESS:
+            self._reader_fur.result()._append_data(data)
+
+            return True
+
+        if (
+            self._body_len == parsers.BODY_IS_CHUNKED
+            or len(data) > self._body_len
+        ):
+            return False
+
+        self._append_body(data)
+
+        return True
+
     def _data_appended(self) -> None:
-        if self._read_finished():
-            return
+        reader_fur = self._reader_fur
 
         try:
-            if not self._reader_fur.done():
+            if not reader_fur.done():
                 self._try_parse_initial()
 
+                if not reader_fur.done():
+                    return
+
             if (
-                self._reader_fur.done()
-                and self._reader_fur.exception() is None
+                reader_fur.exception() is not None
+                or reader_fur.result().end_appended()
             ):
-                self._try_parse_body()
+                return
+
+            self._try_parse_body()
 
         except parsers.UnparsableHttpMessage as e:
             exc = readers.ReceivedDataMalformedError()
@@ -244,14 +341,7 @@ class BaseH1StreamManager(
         return self._read_finished() and self._write_finished
 
     async def _wait_finished(self) -> None:
-        with contextlib.suppress(readers.BaseReadException):
-            reader = await self._reader_fur.safe_await()
-            await reader.wait_end()
-
-        await self._writer_ready.wait()
-
-        if self._writer:
-            await self._writer.wait_finished()
+        await self._stream_finished.wait()
 
     @abc.abstractmethod
     def _is_last_stream(self) -> Optional[bool]:  # pragma: no cover
@@ -267,16 +357,17 @@ class BaseH1StreamManager(
 
             raise writers.WriteAfterFinishedError
 
-        if self._write_chunked_body is None:
+        if self._compose_body_parts is None:
             raise RuntimeError(
                 "Please write the initial before writing its body."
             )
 
-        if self._write_chunked_body:
-            data = composers.compose_chunked_body(data, finished=finished)
+        parts = self._compose_body_parts(data, finished)
 
         try:
-            self._transport.write(data)
+            # Selector transports never drain an empty part on 3.12+.
+            if parts:
+                self._transport.writelines(parts)
 
         except Exception as e:
             exc = writers.WriteAbortedError()
@@ -301,6 +392,11 @@ class BaseH1StreamManager(
         await self._protocol._flush()
 
     def _maybe_cleanup(self) -> None:
+        if self._stream_finished.is_set() or not self._finished():
+            return
+
+        self._stream_finished.set()
+
         if self._is_last_stream() is True:
             self._transport.close()
 
@@ -330,7 +426,6 @@ class BaseH1StreamManager(
 
         self._write_exc = exc
 
-        self._writer_ready.set()
         self._write_finished = True
 
         self._maybe_cleanup()
@@ -407,10 +502,12 @@ class H1ClientStreamManager(
             return
 
         initial = parsers.parse_response_initial(
-            self._buf, self._writer.initial
+            self._buf, self._writer.initial, start_pos=self._initial_scan_pos
         )
 
         if initial is None:
+            self._initial_scan_pos = self._next_initial_scan_pos()
+
             if len(self._buf) > self._max_initial_size:
                 self.pause_reading()
 
@@ -453,12 +550,14 @@ class H1ClientStreamManager(
         )
 
         try:
-            if "transfer-encoding" not in initial.headers.keys():
-                self._write_chunked_body = False
+            if "transfer-encoding" in initial.headers.keys() and (
+                parsers.is_chunked_body(initial.headers["transfer-encoding"])
+            ):
+                self._compose_body_parts = composers.compose_chunked_body_parts
 
             else:
-                self._write_chunked_body = parsers.is_chunked_body(
-                    initial.headers["transfer-encoding"]
+                self._compose_body_parts = (
+                    composers.compose_identity_body_parts
                 )
 
             self._transport.write(initial_bytes)
@@ -473,7 +572,6 @@ class H1ClientStreamManager(
         writer = writers.HttpRequestWriter(self, initial=initial)
 
         self.__writer = writer
-        self._writer_ready.set()
 
         self._data_appended()
 
@@ -567,9 +665,13 @@ class H1ServerStreamManager(
         return self.__writer
 
     def _try_parse_initial(self) -> None:
-        initial = parsers.parse_request_initial(self._buf)
+        initial = parsers.parse_request_initial(
+            self._buf, start_pos=self._initial_scan_pos
+        )
 
         if initial is None:
+            self._initial_scan_pos = self._next_initial_scan_pos()
+
             if len(self._buf) > self._max_initial_size:
                 self.pause_reading()
 
@@ -621,12 +723,14 @@ class H1ServerStreamManager(
         )
 
         try:
-            if "transfer-encoding" not in initial.headers.keys():
-                self._write_chunked_body = False
+            if "transfer-encoding" in initial.headers.keys() and (
+                parsers.is_chunked_body(initial.headers["transfer-encoding"])
+            ):
+                self._compose_body_parts = composers.compose_chunked_body_parts
 
             else:
-                self._write_chunked_body = parsers.is_chunked_body(
-                    initial.headers["transfer-encoding"]
+                self._compose_body_parts = (
+                    composers.compose_identity_body_parts
                 )
 
             self._transport.write(initial_bytes)
@@ -643,7 +747,6 @@ class H1ServerStreamManager(
         )
 
         self.__writer = writer
-        self._writer_ready.set()
 
         return writer
 
@@ -15,7 +15,7 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-from typing import Iterable, Mapping, Optional, Tuple, Union
+from typing import Optional
 import typing
 
 if typing.TYPE_CHECKING:  # pragma: no cover
@@ -25,8 +25,6 @@ if typing.TYPE_CHECKING:  # pragma: no cover
 
 __all__ = ["HttpRequestInitial", "HttpResponseInitial"]
 
-_HeaderType = Union[Mapping[str, str], Iterable[Tuple[str, str]]]
-
 
 class HttpRequestInitial:
     """
@@ -92,23 +90,21 @@ class HttpRequestInitial:
         return self._headers
 
     def __repr__(self) -> str:  # pragma: no cover
-        parts = [
-            ("method", repr(self._method)),
-            ("uri", repr(self._uri)),
-            ("version", repr(self._version)),
-        ]
+        args_repr = (
+            f"method={self._method!r}, uri={self._uri!r}, "
+            f"version={self._version!r}"
+        )
 
         if self._authority is not None:
-            parts.append(("authority", repr(self._authority)))
+            args_repr += f", authority={self._authority!r}"
 
         if self._scheme is not None:
-            parts.append(("scheme", repr(self._scheme)))
-
-        parts.append(("headers", repr(self._headers)))
-
-        args_repr = ", ".join([f"{k}={v}" for k, v in parts])
+            args_repr += f", scheme={self._scheme!r}"
 
-        return f"{self.__class__.__name__}({args_repr})"
+        return (
+            f"{self.__class__.__name__}({args_repr}, "
+            f"headers={self._headers!r})"
+        )
 
     def __str__(self) -> str:  # pragma: no cover
         return repr(self)
@@ -146,15 +142,10 @@ class HttpResponseInitial:
         return self._headers
 
     def __repr__(self) -> str:  # pragma: no cover
-        parts = [
-            ("status_code", repr(self._status_code)),
-            ("version", repr(self._version)),
-            ("headers", repr(self._headers)),
-        ]
-
-        args_repr = ", ".join([f"{k}={v}" for k, v in parts])
-
-        return f"{self.__class__.__name__}({args_repr})"
+        return (
+            f"{self.__class__.__name__}(status_code={self._status_code!r}, "
+            f"version={self._version!r}, headers={self._headers!r})"
+        )
 
     def __str__(self) -> str:  # pragma: no cover
         return repr(self)
@@ -30,6 +30,14 @@ __all__ = ["BaseHttpProtocol", "HttpServerProtocol", "HttpClientProtocol"]
 _HeaderType = Union[Mapping[str, str], Iterable[Tuple[str, str]]]
 
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    _BaseProtocol = asyncio.BufferedProtocol
+
+else:
+    # asyncio.BufferedProtocol is not available before Python 3.7.
+    _BaseProtocol = getattr(asyncio, "BufferedProtocol", asyncio.Protocol)
+
+
 class BaseHttpProtocolDelegate(abc.ABC):  # pragma: nocover
     @abc.abstractmethod
     def __init__(
@@ -38,7 +46,7 @@ class BaseHttpProtocolDelegate(abc.ABC):  # pragma: nocover
         raise NotImplementedError
 
     @abc.abstractmethod
-    def data_received(self, data: bytes) -> None:
+    def data_received(self, data: Union[bytes, memoryview]) -> None:
         raise NotImplementedError
 
     @abc.abstractmethod
@@ -58,32 +66,47 @@ class BaseHttpProtocolDelegate(abc.ABC):  # pragma: nocover
         raise NotImplementedError
 
 
-class BaseHttpProtocol(asyncio.Protocol, abc.ABC):
+class BaseHttpProtocol(_BaseProtocol, abc.ABC):
     """
     The base protocol for :class:`HttpServerProtocol` and
     :class:`HttpClientProtocol`.
     """
 
     __slots__ = (
-        "_drained_event",
+        "_writing_paused",
+        "_drained_fur",
         "_open_after_eof",
         "_transport",
         "_conn_lost",
+        "_conn_lost_fur",
+        "_loop",
+        "_recv_buf",
+        "_delegate",
     )
 
+    # Left unset until connection_made() so that callbacks can use it without
+    # checking whether it is ready.
+    _delegate: BaseHttpProtocolDelegate
+
     _MAX_INITIAL_SIZE = 64 * 1024  # 64K
+    _RECV_BUF_SIZE = 64 * 1024  # 64K
 
     def __init__(self) -> None:
         super().__init__()
 
-        self._drained_event = asyncio.Event()
-        self._drained_event.set()
+        self._writing_paused = False
+        self._drained_fur: Optional["asyncio.Future[None]"] = None
 
         self._open_after_eof = True
 
         self._transport: Optional[asyncio.Transport] = None
 
-        self._conn_lost = asyncio.Event()
+        self._conn_lost = False
+        self._conn_lost_fur: Optional["asyncio.Future[None]"] = None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._recv_buf: Optional[memoryview] = None
 
     def connection_made(  # type: ignore
         self, transport: asyncio.Transport
@@ -92,11 +115,6 @@ class BaseHttpProtocol(asyncio.Protocol, abc.ABC):
 
         self._transport = transport
 
-    @property
-    @abc.abstractmethod
-    def _delegate(self) -> BaseHttpProtocolDelegate:  # pragma: no cover
-        raise NotImplementedError
-
     @property
     def transport(self) -> asyncio.Transport:
         """
@@ -108,26 +126,51 @@ class BaseHttpProtocol(asyncio.Protocol, abc.ABC):
         return self._transport
 
     def pause_writing(self) -> None:
-        if not self._drained_event.is_set():
-            return
-
-        self._drained_event.clear()
+        self._writing_paused = True
 
     def resume_writing(self) -> None:
-        if self._drained_event.is_set():
-            return
+        self._writing_paused = False
 
-        self._drained_event.set()
+        if self._drained_fur is not None:
+            if not self._drained_fur.done():
+                self._drained_fur.set_result(None)
+
+            self._drained_fur = None
 
     async def _flush(self) -> None:
-        if self._drained_event.is_set():
+        if not self._writing_paused:
             return
 
-        await self._drained_event.wait()
+        if self._drained_fur is None:
+            if self._loop is None:
+                self._loop = asyncio.get_event_loop()
+
+            self._drained_fur = self._loop.create_future()
+
+        await asyncio.shield(self._drained_fur)
 
     def data_received(self, data: bytes) -> None:
         self._delegate.data_received(data)
 
+    def get_buffer(self, sizehint: int) -> memoryview:
+        if self._recv_buf is None:
+            self._recv_buf = memoryview(bytearray(self._RECV_BUF_SIZE))
+
+        return self._recv_buf
+
+    def buffer_updated(self, nbytes: int) -> None:
+        assert self._recv_buf is not None
+
+        data = self._recv_buf[:nbytes]
+
+        if nbytes < len(self._recv_buf):
+            # The socket has been drained. Idle connections should not hold
+            # on to a receive buffer, so it is only kept while reads fill it.
+            self._recv_buf = None
+
+        # The delegate copies anything it needs to keep before returning.
+        self._delegate.data_received(data)
+
     def eof_received(self) -> bool:
         self._delegate.eof_received()
 
@@ -143,15 +186,30 @@ class BaseHttpProtocol(asyncio.Protocol, abc.ABC):
         """
         Wait until :method:`.connection_lost()` is called.
         """
-        await self._conn_lost.wait()
+        if self._conn_lost:
+            return
+
+        if self._conn_lost_fur is None:
+            if self._loop is None:
+                self._loop = asyncio.get_event_loop()
+
+            self._conn_lost_fur = self._loop.create_future()
+
+        await asyncio.shield(self._conn_lost_fur)
 
     def connection_lost(self, exc: Optional[BaseException]) -> None:
         if hasattr(self, "_delegate"):
             self._delegate.connection_lost(exc)
 
-        self._drained_event.set()
+        self.resume_writing()
+
+        self._conn_lost = True
 
-        self._conn_lost.set()
+        if self._conn_lost_fur is not None:
+            if not self._conn_lost_fur.done():
+                self._conn_lost_fur.set_result(None)
+
+            self._conn_lost_fur = None
 
 
 class HttpServerProtocolDelegate(BaseHttpProtocolDelegate):  # pragma: no cover
@@ -165,6 +223,12 @@ class HttpServerProtocolDelegate(BaseHttpProtocolDelegate):  # pragma: no cover
     async def read_request(self) -> readers.HttpRequestReader:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    async def read_request_or_none(
+        self,
+    ) -> Optional[readers.HttpRequestReader]:
+        raise NotImplementedError
+
 
 class HttpServerProtocol(
     BaseHttpProtocol, AsyncIterator[readers.HttpRequestReader]
@@ -173,26 +237,16 @@ class HttpServerProtocol(
     The http server protocol.
     """
 
-    __slots__ = ("__delegate",)
-
-    def __init__(self) -> None:
-        super().__init__()
-
-        self.__delegate: Optional[HttpServerProtocolDelegate] = None
+    __slots__ = ()
 
-    @property
-    def _delegate(self) -> HttpServerProtocolDelegate:
-        if self.__delegate is None:  # pragma: no cover
-            raise AttributeError("Delegate is not ready.")
-
-        return self.__delegate
+    _delegate: HttpServerProtocolDelegate
 
     def connection_made(  # type: ignore
         self, transport: asyncio.Transport
     ) -> None:
         super().connection_made(transport)
 
-        self.__delegate = h1impl.H1ServerImpl(self, self._MAX_INITIAL_SIZE)
+        self._delegate = h1impl.H1ServerImpl(self, self._MAX_INITIAL_SIZE)
 
     def __aiter__(self) -> AsyncIterator[readers.HttpRequestReader]:
         return self
@@ -207,11 +261,16 @@ class HttpServerProtocol(
                 ...
         """
         try:
-            return await self._delegate.read_request()
+            reader = await self._delegate.read_request_or_none()
 
         except (readers.ReadFinishedError, readers.ReadAbortedError) as e:
             raise StopAsyncIteration from e
 
+        if reader is None:
+            raise StopAsyncIteration
+
+        return reader
+
 
 class HttpClientProtocolDelegate(BaseHttpProtocolDelegate):  # pragma: no cover
     @abc.abstractmethod
@@ -241,7 +300,9 @@ class HttpClientProtocol(BaseHttpProtocol):
     The http client protocol.
     """
 
-    __slots__ = ("__delegate", "_http_version")
+    __slots__ = ("_http_version",)
+
+    _delegate: HttpClientProtocolDelegate
 
     def __init__(
         self,
@@ -252,21 +313,12 @@ class HttpClientProtocol(BaseHttpProtocol):
 
         self._http_version = http_version
 
-        self.__delegate: Optional[HttpClientProtocolDelegate] = None
-
-    @property
-    def _delegate(self) -> HttpClientProtocolDelegate:
-        if self.__delegate is None:  # pragma: no cover
-            raise AttributeError("Delegate is not ready.")
-
-        return self.__delegate
-
     def connection_made(  # type: ignore
         self, transport: asyncio.Transport
     ) -> None:
         super().connection_made(transport)
 
-        self.__delegate = h1impl.H1ClientImpl(
+        self._delegate = h1impl.H1ClientImpl(
             self, self._MAX_INITIAL_SIZE, self._http_version
         )
 
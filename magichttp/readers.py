@@ -15,7 +15,7 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-from typing import Any, Iterable, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, Iterable, Mapping, Optional, Tuple, Union
 import abc
 import asyncio
 import typing
@@ -43,6 +43,21 @@ __all__ = [
 
 _HeaderType = Union[Mapping[str, str], Iterable[Tuple[str, str]]]
 
+# bytearray.take_bytes() (Python 3.15+) hands over the content without a copy.
+_TAKE_BYTES: Optional[Callable[[bytearray], bytes]] = getattr(
+    bytearray, "take_bytes", None
+)
+
+
+def _take_all_bytes(buf: bytearray) -> bytes:
+    if _TAKE_BYTES is not None:
+        return _TAKE_BYTES(buf)
+
+    data = bytes(buf)
+    buf.clear()
+
+    return data
+
 
 class BaseReadException(Exception):
     """
@@ -86,7 +101,7 @@ class RequestInitialTooLargeError(EntityTooLargeError):
         :method:`BaseHttpStreamReader.write_response()`.
         """
         return self._delegate.write_response(
-            constants.HttpStatusCode(status_code), headers=headers
+            constants.refine_status_code(status_code), headers=headers
         )
 
 
@@ -167,7 +182,7 @@ class RequestInitialMalformedError(ReceivedDataMalformedError):
         :method:`BaseHttpStreamReader.write_response()`.
         """
         return self._delegate.write_response(
-            constants.HttpStatusCode(status_code), headers=headers
+            constants.refine_status_code(status_code), headers=headers
         )
 
 
@@ -196,8 +211,10 @@ class BaseHttpStreamReader(abc.ABC):
         "_max_buf_len",
         "_buf",
         "_wait_for_data_fur",
-        "_read_lock",
+        "_loop",
+        "_reading",
         "_end_appended",
+        "_end_fur",
         "_exc",
     )
 
@@ -207,21 +224,23 @@ class BaseHttpStreamReader(abc.ABC):
 
         self._buf = bytearray()
         self._wait_for_data_fur: Optional["asyncio.Future[None]"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
-        self._read_lock = asyncio.Lock()
+        self._reading = False
 
-        self._end_appended = asyncio.Event()
+        self._end_appended = False
+        self._end_fur: Optional["asyncio.Future[None]"] = None
         self._exc: Optional[BaseReadException] = None
 
     def _append_data(self, data: Union[bytes, bytearray, memoryview]) -> None:
-        assert not self._end_appended.is_set(), "Append data after ended."
+        assert not self._end_appended, "Append data after ended."
 
         if not data:  # pragma: no cover
             return
 
         self._buf += data
 
-        if len(self) >= self.max_buf_len:
+        if len(self._buf) >= self._max_buf_len:
             self._delegate.pause_reading()
 
         if (
@@ -231,13 +250,16 @@ class BaseHttpStreamReader(abc.ABC):
             self._wait_for_data_fur.set_result(None)
 
     def _append_end(self, exc: Optional[BaseReadException]) -> None:
-        if self._end_appended.is_set():  # pragma: no cover
+        if self._end_appended:  # pragma: no cover
             return
 
         if exc:
             self._exc = exc
 
-        self._end_appended.set()
+        self._end_appended = True
+
+        if self._end_fur is not None and not self._end_fur.done():
+            self._end_fur.set_result(None)
 
         if (
             self._wait_for_data_fur is not None
@@ -255,7 +277,7 @@ class BaseHttpStreamReader(abc.ABC):
         raise ReadFinishedError
 
     def _raise_exc_if_end_appended(self) -> None:
-        if not self._end_appended.is_set():
+        if not self._end_appended:
             return
 
         if self._exc:
@@ -268,7 +290,10 @@ class BaseHttpStreamReader(abc.ABC):
 
         self._delegate.resume_reading()
 
-        self._wait_for_data_fur = asyncio.Future()
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+
+        self._wait_for_data_fur = self._loop.create_future()
         try:
             await self._wait_for_data_fur
 
@@ -280,6 +305,14 @@ class BaseHttpStreamReader(abc.ABC):
         finally:
             self._wait_for_data_fur = None
 
+    def _start_reading(self) -> None:
+        if self._reading:
+            raise RuntimeError(
+                "Another coroutine is already reading from this reader."
+            )
+
+        self._reading = True
+
     @property
     def max_buf_len(self) -> int:
         """
@@ -311,7 +344,8 @@ class BaseHttpStreamReader(abc.ABC):
         When :method:`.finished()` is `True`, this method will raise any errors
         occurred during the read or a :class:`ReadFinishedError`.
         """
-        async with self._read_lock:
+        self._start_reading()
+        try:
             self._raise_exc_if_finished()
 
             if n == 0:
@@ -324,13 +358,13 @@ class BaseHttpStreamReader(abc.ABC):
                         "if exactly is True."
                     )
 
-                if n > self.max_buf_len:  # pragma: no cover
+                if n > self._max_buf_len:  # pragma: no cover
                     raise ValueError(
                         "The length provided cannot be larger "
                         "than the max buffer length."
                     )
 
-                while len(self) < n:
+                while len(self._buf) < n:
                     try:
                         await self._wait_for_data()
 
@@ -338,12 +372,12 @@ class BaseHttpStreamReader(abc.ABC):
                         raise
 
                     except Exception as e:
-                        if len(self) < n:
+                        if len(self._buf) < n:
                             raise ReadUnsatisfiableError from e
 
             elif n < 0:
                 while True:
-                    if len(self) > self.max_buf_len:
+                    if len(self._buf) > self._max_buf_len:
                         raise MaxBufferLengthReachedError
 
                     try:
@@ -353,12 +387,9 @@ class BaseHttpStreamReader(abc.ABC):
                         raise
 
                     except Exception:
-                        data = bytes(self._buf)
-                        self._buf.clear()
-
-                        return data
+                        return _take_all_bytes(self._buf)
 
-            elif len(self) == 0:
+            elif len(self._buf) == 0:
                 try:
                     await self._wait_for_data()
 
@@ -366,14 +397,22 @@ class BaseHttpStreamReader(abc.ABC):
                     raise
 
                 except Exception:
-                    if len(self) == 0:
+                    if len(self._buf) == 0:
                         raise
 
-            data = bytes(self._buf[0:n])
-            del self._buf[0:n]
+            if n >= len(self._buf):
+                # Draining the whole buffer, skip the intermediate slice.
+                data = _take_all_bytes(self._buf)
+
+            else:
+                data = bytes(self._buf[0:n])
+                del self._buf[0:n]
 
             return data
 
+        finally:
+            self._reading = False
+
     async def read_until(
         self, separator: bytes = b"\n", *, keep_separator: bool = True
     ) -> bytes:
@@ -389,7 +428,8 @@ class BaseHttpStreamReader(abc.ABC):
         When :method:`.finished()` is `True`, this method will raise any errors
         occurred during the read or a :class:`ReadFinishedError`.
         """
-        async with self._read_lock:
+        self._start_reading()
+        try:
             self._raise_exc_if_finished()
 
             start_pos = 0
@@ -400,10 +440,15 @@ class BaseHttpStreamReader(abc.ABC):
                 if separator_pos != -1:
                     break
 
-                if len(self) > self.max_buf_len:
+                if len(self._buf) > self._max_buf_len:
                     raise MaxBufferLengthReachedError
 
-                before_wait_buf_len = len(self)
+                # Any separator not found yet has to end in data that has
+                # not arrived, so the next search only needs to look back
+                # len(separator) - 1 bytes. start_pos never moves backwards.
+                start_pos = max(start_pos, len(self._buf) - len(separator) + 1)
+
+                before_wait_buf_len = len(self._buf)
                 try:
                     await self._wait_for_data()
 
@@ -411,21 +456,16 @@ class BaseHttpStreamReader(abc.ABC):
                     raise
 
                 except Exception as e:
-                    if len(self) != before_wait_buf_len:
+                    if len(self._buf) != before_wait_buf_len:
                         # There're some more data to be checked.
                         continue
 
-                    if len(self) > 0:
+                    if len(self._buf) > 0:
                         raise SeparatorNotFoundError from e
 
                     else:
                         raise
 
-                new_start_pos = len(self) - len(separator)
-
-                if new_start_pos > 0:
-                    start_pos = new_start_pos
-
             full_pos = separator_pos + len(separator)
 
             if keep_separator:
@@ -434,31 +474,47 @@ class BaseHttpStreamReader(abc.ABC):
             else:
                 data_pos = separator_pos
 
-            data = bytes(self._buf[0:data_pos])
-            del self._buf[0:full_pos]
+            if data_pos == len(self._buf):
+                data = _take_all_bytes(self._buf)
+
+            else:
+                data = bytes(self._buf[0:data_pos])
+                del self._buf[0:full_pos]
 
             return data
 
+        finally:
+            self._reading = False
+
     def busy(self) -> bool:
         """
         Return `True` if the reader is reading.
         """
-        return self._read_lock.locked()
+        return self._reading
 
     async def wait_end(self) -> None:
         """
         Wait until the end has been appended.
         """
-        await self._end_appended.wait()
+        if self._end_appended:
+            return
+
+        if self._end_fur is None:
+            if self._loop is None:
+                self._loop = asyncio.get_event_loop()
+
+            self._end_fur = self._loop.create_future()
+
+        await asyncio.shield(self._end_fur)
 
     def end_appended(self) -> bool:
-        return self._end_appended.is_set()
+        return self._end_appended
 
     def finished(self) -> bool:
         """
         Return `True` if the reader reached the end of the Request or Response.
         """
-        return len(self) == 0 and self._end_appended.is_set()
+        return len(self._buf) == 0 and self._end_appended
 
     def abort(self) -> None:
         """
@@ -530,7 +586,7 @@ class HttpRequestReader(BaseHttpStreamReader):
         Write a response to the client.
         """
         self._writer = self.__delegate.write_response(
-            constants.HttpStatusCode(status_code), headers=headers
+            constants.refine_status_code(status_code), headers=headers
         )
 
         return self._writer
@@ -84,7 +84,7 @@ class BaseHttpStreamWriter(abc.ABC):
     def __init__(self, __delegate: BaseHttpStreamWriterDelegate) -> None:
         self._delegate = __delegate
 
-        self._flush_lock = asyncio.Lock()
+        self._flush_lock: Optional[asyncio.Lock] = None
 
         self._finished = asyncio.Event()
         self._exc: Optional[BaseWriteException] = None
@@ -117,6 +117,9 @@ class BaseHttpStreamWriter(abc.ABC):
         Give the writer a chance to flush the pending data
         out of the internal buffer.
         """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
         async with self._flush_lock:
             if self.finished():
                 if self._exc:
@@ -26,6 +26,8 @@ from magichttp import (
 )
 from magichttp.h1impl.composers import (
     compose_chunked_body,
+    compose_chunked_body_parts,
+    compose_identity_body_parts,
     compose_request_initial,
     compose_response_initial,
 )
@@ -340,3 +342,15 @@ def test_normal_last_chunk() -> None:
 
 def test_empty_last_chunk() -> None:
     assert compose_chunked_body(b"", finished=True) == b"0\r\n\r\n"
+
+
+def test_chunked_body_parts() -> None:
+    assert compose_chunked_body_parts(b"ab") == (b"2\r\n", b"ab", b"\r\n")
+    assert compose_chunked_body_parts(b"") == ()
+
+
+def test_identity_body_parts() -> None:
+    assert compose_identity_body_parts(b"a") == (b"a",)
+    assert compose_identity_body_parts(b"a", True) == (b"a",)
+    assert compose_identity_body_parts(b"") == ()
+    assert compose_identity_body_parts(b"", True) == ()
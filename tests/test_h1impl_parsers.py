@@ -79,6 +79,22 @@ class H1ParseRequestInitialTestCase:
         assert not hasattr(req, "authority")
         assert not hasattr(req, "scheme")
 
+    def test_resumed_request(self):
+        buf = bytearray(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r")
+
+        assert parse_request_initial(buf, start_pos=0) is None
+
+        start_pos = len(buf) - 3
+        buf += b"\n"
+
+        req = parse_request_initial(buf, start_pos=start_pos)
+
+        assert req is not None
+
+        assert req.method == HttpRequestMethod.GET
+        assert req.authority == "localhost"
+        assert buf == b""
+
     def test_simple_post_request(self):
         buf = bytearray(
             b"POST / HTTP/1.1\r\nContent-Length: 20\r\n"
@@ -101,6 +117,9 @@ class H1ParseRequestInitialTestCase:
         with pytest.raises(UnparsableHttpMessage):
             parse_request_initial(bytearray(b"GET / HTTP/3.0\r\n\r\n"))
 
+        with pytest.raises(UnparsableHttpMessage):
+            parse_request_initial(bytearray(b"FETCH / HTTP/1.1\r\n\r\n"))
+
         with pytest.raises(UnparsableHttpMessage):
             parse_request_initial(
                 bytearray(b"GET / HTTP/1.1\r\nContent-Length\r\n\r\n")
@@ -71,6 +71,15 @@ class TransportMock:
     def write(self, data):
         self._data_chunks.append(data)
 
+    def writelines(self, list_of_data):
+        list_of_data = list(list_of_data)
+
+        # Empty parts are never drained by selector transports on 3.12+.
+        assert list_of_data, "Nothing to write."
+        assert all(list_of_data), "Empty part written to the transport."
+
+        self._data_chunks.extend(list_of_data)
+
     def get_extra_info(self, name):
         return self._extra_info.get(name)
 
@@ -315,6 +324,35 @@ class HttpClientProtocolTestCase:
 
         protocol.connection_lost(None)
 
+    @helper.run_async_test
+    async def test_response_with_many_chunks_in_one_packet(self):
+        protocol = HttpClientProtocol()
+        transport_mock = TransportMock()
+
+        protocol.connection_made(transport_mock)
+        protocol.data_received(
+            b"HTTP/1.1 200 OK\r\nTransfer-Encoding: Chunked\r\n\r\n"
+        )
+
+        writer = await protocol.write_request(HttpRequestMethod.GET, uri="/")
+        writer.finish()
+
+        reader = await writer.read_response()
+
+        chunks = [os.urandom(2048) for _ in range(40)]
+
+        protocol.data_received(
+            b"".join(b"800\r\n" + chunk + b"\r\n" for chunk in chunks)
+            + b"0\r\n\r\n"
+        )
+
+        assert await reader.read() == b"".join(chunks)
+
+        assert protocol.eof_received() is True
+        assert transport_mock._closing is True
+
+        protocol.connection_lost(None)
+
     @helper.run_async_test
     async def test_flush_pause_and_resume(self):
         protocol = HttpClientProtocol()
@@ -942,6 +980,27 @@ class HttpServerProtocolTestCase:
 
         assert data.split(b"\r\n\r\n", 1)[1] == b"0\r\n\r\n"
 
+    @helper.run_async_test
+    async def test_anext_after_close(self):
+        protocol = HttpServerProtocol()
+        transport_mock = TransportMock()
+        protocol.connection_made(transport_mock)
+
+        protocol.data_received(b"GET / HTTP/1.1\r\nConnection: Close\r\n\r\n")
+
+        reader = await protocol.__anext__()
+
+        with pytest.raises(ReadFinishedError):
+            await reader.read()
+
+        reader.write_response(HttpStatusCode.NO_CONTENT).finish()
+
+        with pytest.raises(StopAsyncIteration):
+            await protocol.__anext__()
+
+        assert transport_mock._closing is True
+        protocol.connection_lost(None)
+
     @helper.run_async_test
     async def test_simple_request_10(self):
         protocol = HttpServerProtocol()
@@ -1033,6 +1092,141 @@ class HttpServerProtocolTestCase:
 
         assert data.split(b"\r\n\r\n", 1)[1] == b"0\r\n\r\n"
 
+    @helper.run_async_test
+    async def test_request_body_in_pieces(self):
+        protocol = HttpServerProtocol()
+        transport_mock = TransportMock()
+        protocol.connection_made(transport_mock)
+
+        async def aiter_requests():
+            count = 0
+            async for reader in protocol:
+                if count == 0:
+                    assert await reader.read(10, exactly=True) == (
+                        b"1234567890"
+                    )
+
+                with pytest.raises(ReadFinishedError):
+                    await reader.read()
+
+                writer = reader.write_response(HttpStatusCode.NO_CONTENT)
+                writer.finish()
+
+                count += 1
+
+            assert count == 2
+
+        tsk = helper.create_task(aiter_requests())
+
+        protocol.data_received(
+            b"POST / HTTP/1.1\r\nContent-Length: 10\r\n\r\n"
+        )
+
+        await asyncio.sleep(0)
+        assert not tsk.done()
+
+        protocol.data_received(b"12345")
+
+        await asyncio.sleep(0)
+        assert not tsk.done()
+
+        protocol.data_received(
+            b"67890GET / HTTP/1.1\r\nConnection: Close\r\n\r\n"
+        )
+
+        await tsk
+
+        assert protocol.eof_received() is True
+
+        assert transport_mock._closing is True
+        protocol.connection_lost(None)
+
+    @helper.run_async_test
+    async def test_request_from_buffer(self):
+        class SmallBufferProtocol(HttpServerProtocol):
+            _RECV_BUF_SIZE = 16
+
+        protocol = SmallBufferProtocol()
+        transport_mock = TransportMock()
+        protocol.connection_made(transport_mock)
+
+        def feed(data):
+            while data:
+                buf = protocol.get_buffer(-1)
+                n = min(len(buf), len(data))
+                buf[:n] = data[:n]
+                data = data[n:]
+
+                protocol.buffer_updated(n)
+
+                # The buffer is only kept while reads fill it.
+                assert (protocol._recv_buf is buf) is (n == len(buf))
+
+        async def aiter_requests():
+            count = 0
+            async for reader in protocol:
+                assert await reader.read(10, exactly=True) == b"1234567890"
+
+                with pytest.raises(ReadFinishedError):
+                    await reader.read()
+
+                writer = reader.write_response(HttpStatusCode.NO_CONTENT)
+                writer.finish()
+
+                count += 1
+
+            assert count == 1
+
+        tsk = helper.create_task(aiter_requests())
+
+        feed(b"POST / HTTP/1.1\r\nContent-Length: 10\r\n")
+        feed(b"Connection: Close\r\n\r\n12345")
+
+        await asyncio.sleep(0)
+        assert not tsk.done()
+
+        feed(b"67890")
+
+        await tsk
+
+        assert protocol.eof_received() is True
+
+        assert transport_mock._closing is True
+        protocol.connection_lost(None)
+
+    @helper.run_async_test
+    async def test_finish_identity_body(self):
+        protocol = HttpServerProtocol()
+        transport_mock = TransportMock()
+        protocol.connection_made(transport_mock)
+
+        async def aiter_requests():
+            count = 0
+            async for reader in protocol:
+                writer = reader.write_response(
+                    HttpStatusCode.OK, headers={"content-length": "2"}
+                )
+                writer.write(b"ok")
+                # Finishing with no data must not write an empty part.
+                writer.finish()
+
+                count += 1
+
+            assert count == 1
+
+        tsk = helper.create_task(aiter_requests())
+
+        protocol.data_received(b"GET / HTTP/1.1\r\nConnection: Close\r\n\r\n")
+
+        await tsk
+
+        assert transport_mock._closing is True
+        protocol.connection_lost(None)
+
+        data = transport_mock._pop_stored_data()
+
+        assert data.split(b"\r\n\r\n", 1)[1] == b"ok"
+
     @helper.run_async_test
     async def test_simple_response_with_chunked_body(self):
         protocol = HttpServerProtocol()
@@ -1476,6 +1670,25 @@ class HttpServerProtocolTestCase:
 
         assert data.split(b"\r\n\r\n", 1)[1] == b"5\r\n12345\r\n0\r\n\r\n"
 
+    @helper.run_async_test
+    async def test_request_initial_error_subclass(self):
+        class CustomMalformedError(ReceivedDataMalformedError):
+            pass
+
+        protocol = HttpServerProtocol()
+        transport_mock = TransportMock()
+
+        protocol.connection_made(transport_mock)
+        protocol._delegate._stream._set_read_exception(CustomMalformedError())
+
+        with pytest.raises(RequestInitialMalformedError) as exc_info:
+            await protocol.__anext__()
+
+        assert isinstance(exc_info.value.__cause__, CustomMalformedError)
+
+        transport_mock._closing = True
+        protocol.connection_lost(None)
+
     @helper.run_async_test
     async def test_request_chunk_len_too_long(self):
         protocol = HttpServerProtocol()
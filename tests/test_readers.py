@@ -33,6 +33,7 @@ from magichttp import (
 from magichttp.readers import (
     HttpRequestReaderDelegate,
     HttpResponseReaderDelegate,
+    _take_all_bytes,
 )
 
 helper = TestHelper()
@@ -60,6 +61,35 @@ class ReaderDelegateMock(
         return self.writer_mock
 
 
+class TakeAllBytesTestCase:
+    def test_copy(self, monkeypatch):
+        monkeypatch.setattr("magichttp.readers._TAKE_BYTES", None)
+
+        buf = bytearray(b"12345")
+
+        assert _take_all_bytes(buf) == b"12345"
+        assert buf == b""
+
+    def test_take_bytes(self, monkeypatch):
+        taken = []
+
+        def take_bytes(buf):
+            taken.append(buf)
+
+            data = bytes(buf)
+            buf.clear()
+
+            return data
+
+        monkeypatch.setattr("magichttp.readers._TAKE_BYTES", take_bytes)
+
+        buf = bytearray(b"12345")
+
+        assert _take_all_bytes(buf) == b"12345"
+        assert buf == b""
+        assert len(taken) == 1 and taken[0] is buf
+
+
 class HttpRequestReaderTestCase:
     def test_init(self):
         HttpRequestReader(object(), initial=object())
@@ -86,6 +116,26 @@ class HttpRequestReaderTestCase:
 
         assert await tsk == data
 
+    @helper.run_async_test
+    async def test_concurrent_read(self):
+        reader = HttpRequestReader(ReaderDelegateMock(), initial=object())
+
+        tsk = helper.loop.create_task(reader.read(5))
+
+        await asyncio.sleep(0)
+
+        assert reader.busy() is True
+
+        with pytest.raises(RuntimeError):
+            await reader.read_until(b"\n")
+
+        data = os.urandom(5)
+
+        reader._append_data(data)
+
+        assert await tsk == data
+        assert reader.busy() is False
+
     @helper.run_async_test
     async def test_read_end(self):
         reader = HttpRequestReader(ReaderDelegateMock(), initial=object())
@@ -295,6 +345,26 @@ class HttpRequestReaderTestCase:
         with pytest.raises(SeparatorNotFoundError):
             await reader.read_until()
 
+    @helper.run_async_test
+    async def test_read_until_separator_in_chunk(self):
+        reader = HttpRequestReader(ReaderDelegateMock(), initial=object())
+
+        tsk = helper.loop.create_task(reader.read_until(b"\r\n"))
+
+        await asyncio.sleep(0)
+
+        reader._append_data(b"abc\r")
+
+        await asyncio.sleep(0)
+
+        with pytest.raises(asyncio.InvalidStateError):
+            tsk.result()
+
+        reader._append_data(b"\ndef\r\nghi")
+
+        assert await tsk == b"abc\r\n"
+        assert await reader.read_until(b"\r\n") == b"def\r\n"
+
     @helper.run_async_test
     async def test_abort(self):
         mock = ReaderDelegateMock()